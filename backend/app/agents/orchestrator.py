@@ -8,21 +8,79 @@ and manages conversation context using Groq Llama 3.3.
 Author: Jagadeep Mamidi
 """
 
+import asyncio
+import json
 import logging
 import re
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import get_settings
-from app.rag.hybrid_retriever import HybridRetriever
+from app.rag.context import prepare_context
+from app.rag.hybrid_retriever import HybridRetriever, get_retriever
 from app.services.llm import get_llm_service
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Streamed characters held back so the greeting cleanup can see the whole intro
+INTRO_HOLD_CHARS = 160
+
+# Sentinel returned by next() when the LLM stream is exhausted
+_STREAM_END = object()
+
+# Reply recorded and returned when answer generation fails
+RESPONSE_ERROR_MESSAGE = (
+    "I apologize, but I encountered an error while processing your question. "
+    "Please try again."
+)
+
+
+# System prompts per response language; unknown languages fall back to English
+LANGUAGE_PROMPTS = {
+    "te": """You are Sahay AI (సహాయ AI), a helpful and empathetic assistant that helps Indian citizens discover and understand government welfare schemes.
+
+NALKAVATCHALU (GUIDELINES):
+1. Be warm, friendly, and use simple Telugu that everyone can understand
+2. Base your answers on the provided context from official scheme documents
+3. If information is not in the context, say so honestly
+4. When discussing eligibility, be clear about requirements
+5. Provide actionable next steps when possible
+6. Use ₹ symbol for Indian Rupees
+7. Be culturally sensitive and respectful
+8. Always respond in Telugu (తెలుగు)
+
+Keep responses concise but informative.""",
+    "hi": """आप Sahay AI (सहाय AI) हैं, जो भारतीय नागरिकों को सरकारी कल्याण योजनाओं को खोजने और समझने में मदद करने वाले सहायक हैं।
+
+दिशानिर्देश (GUIDELINES):
+1. गर्मजोशी से बात करें और सरल हिंदी का उपयोग करें
+2. अपने उत्तर आधिकारिक योजना दस्तावेजों से प्रदान की गई जानकारी पर आधारित करें
+3. यदि जानकारी संदर्भ में नहीं है, तो ईमानदारी से बताएं
+4. पात्रता पर चर्चा करते समय आवश्यकताओं के बारे में स्पष्ट रहें
+5. जब भी संभव हो, कार्रवाई योग्य अगले कदम प्रदान करें
+6. भारतीय रुपये के लिए ₹ प्रतीक का उपयोग करें
+7. सांस्कृतिक रूप से संवेदनशील और सम्मानजनक रहें
+8. हमेशा हिंदी में जवाब दें
+
+जवाब संक्षिप्त लेकिन जानकारीपूर्ण रखें।""",
+    "en": """You are Sahay AI (सहाय AI), a helpful and empathetic assistant that helps Indian citizens discover and understand government welfare schemes.
+
+GUIDELINES:
+1. Be warm, friendly, and use simple language that everyone can understand
+2. Base your answers on the provided context from official scheme documents
+3. If information is not in the context, say so honestly and suggest where to find it
+4. When discussing eligibility, be clear about requirements
+5. Provide actionable next steps when possible
+6. Use ₹ symbol for Indian Rupees
+7. Be culturally sensitive and respectful
+
+Keep responses concise but informative (2-4 paragraphs max).""",
+}
+
 
 class ConversationMemory:
     """
@@ -90,7 +148,6 @@ class AgentOrchestrator:
 
     def __init__(self):
         self.memory = ConversationMemory()
-        self.retriever = HybridRetriever()
         self.llm = get_llm_service()
 
         self.intent_categories = {
@@ -106,19 +163,63 @@ class AgentOrchestrator:
             "feedback": "User providing feedback",
             "unknown": "Cannot determine the intent",
         }
+        # Rendered once; the intent list is identical for every classification
+        self._intent_list_text = "\n".join(
+            f"- {k}: {v}" for k, v in self.intent_categories.items()
+        )
 
         logger.info("AgentOrchestrator initialized with Groq Llama 3.3")
 
+    @property
+    def retriever(self) -> HybridRetriever:
+        """
+        Shared retriever singleton.
+
+        Resolved on each access so documents added through the admin routes
+        and the fresh index built after a reindex are visible to chat.
+        """
+        return get_retriever()
+
     async def _call_llm(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Call Groq LLM API with retry logic."""
+        """
+        Call Groq LLM API with retry logic.
+
+        The Groq SDK client is blocking, so the call runs in a worker thread
+        to keep the event loop free for other requests and concurrent work.
+        """
         try:
-            if system_prompt:
-                return self.llm.complete(prompt, system_prompt=system_prompt)
-            return self.llm.complete(prompt)
+            return await asyncio.to_thread(
+                self.llm.complete, prompt, system_prompt=system_prompt
+            )
         except Exception as e:
             logger.error(f"LLM API error: {e}")
             raise
 
+    async def _stream_llm(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream Groq LLM output as text deltas.
+
+        Each blocking read from the SDK stream runs in a worker thread, so
+        the event loop keeps serving other requests between tokens.
+        """
+        stream = self.llm.complete_stream(prompt, system_prompt=system_prompt)
+        try:
+            while True:
+                delta = await asyncio.to_thread(next, stream, _STREAM_END)
+                if delta is _STREAM_END:
+                    return
+                yield delta
+        finally:
+            try:
+                # Closes the Groq HTTP stream when the consumer stops early
+                stream.close()
+            except ValueError:
+                # Cancelled mid-read: the worker thread still owns the
+                # generator, which is released once that read returns
+                pass
+
     async def classify_intent(self, query: str) -> Dict[str, Any]:
         """
         Classify user intent using Groq LLM.
@@ -130,7 +231,7 @@ class AgentOrchestrator:
 User Query: "{query}"
 
 Possible intents:
-{chr(10).join(f"- {k}: {v}" for k, v in self.intent_categories.items())}
+{self._intent_list_text}
 
 Respond with JSON format:
 {{"intent": "intent_name", "confidence": 0.0-1.0, "entities": {{"scheme_name": null, "category": null, "state": null}}}}
@@ -139,8 +240,6 @@ Only output the JSON, no other text."""
 
             response = await self._call_llm(prompt)
 
-            import json
-
             try:
                 clean_response = response.strip()
                 if clean_response.startswith("```"):
@@ -159,48 +258,7 @@ Only output the JSON, no other text."""
 
     def _get_language_specific_prompt(self, language: str) -> str:
         """Get language-specific system prompt."""
-        prompts = {
-            "te": """You are Sahay AI (సహాయ AI), a helpful and empathetic assistant that helps Indian citizens discover and understand government welfare schemes.
-
-NALKAVATCHALU (GUIDELINES):
-1. Be warm, friendly, and use simple Telugu that everyone can understand
-2. Base your answers on the provided context from official scheme documents
-3. If information is not in the context, say so honestly
-4. When discussing eligibility, be clear about requirements
-5. Provide actionable next steps when possible
-6. Use ₹ symbol for Indian Rupees
-7. Be culturally sensitive and respectful
-8. Always respond in Telugu (తెలుగు)
-
-Keep responses concise but informative.""",
-            "hi": """आप Sahay AI (सहाय AI) हैं, जो भारतीय नागरिकों को सरकारी कल्याण योजनाओं को खोजने और समझने में मदद करने वाले सहायक हैं।
-
-दिशानिर्देश (GUIDELINES):
-1. गर्मजोशी से बात करें और सरल हिंदी का उपयोग करें
-2. अपने उत्तर आधिकारिक योजना दस्तावेजों से प्रदान की गई जानकारी पर आधारित करें
-3. यदि जानकारी संदर्भ में नहीं है, तो ईमानदारी से बताएं
-4. पात्रता पर चर्चा करते समय आवश्यकताओं के बारे में स्पष्ट रहें
-5. जब भी संभव हो, कार्रवाई योग्य अगले कदम प्रदान करें
-6. भारतीय रुपये के लिए ₹ प्रतीक का उपयोग करें
-7. सांस्कृतिक रूप से संवेदनशील और सम्मानजनक रहें
-8. हमेशा हिंदी में जवाब दें
-
-जवाब संक्षिप्त लेकिन जानकारीपूर्ण रखें।""",
-            "en": """You are Sahay AI (सहाय AI), a helpful and empathetic assistant that helps Indian citizens discover and understand government welfare schemes.
-
-GUIDELINES:
-1. Be warm, friendly, and use simple language that everyone can understand
-2. Base your answers on the provided context from official scheme documents
-3. If information is not in the context, say so honestly and suggest where to find it
-4. When discussing eligibility, be clear about requirements
-5. Provide actionable next steps when possible
-6. Use ₹ symbol for Indian Rupees
-7. Be culturally sensitive and respectful
-
-Keep responses concise but informative (2-4 paragraphs max).""",
-        }
-
-        return prompts.get(language, prompts["en"])
+        return LANGUAGE_PROMPTS.get(language, LANGUAGE_PROMPTS["en"])
 
     def _clean_response_intro(
         self, response: str, intent: str, history: List[Dict]
@@ -228,51 +286,54 @@ Keep responses concise but informative (2-4 paragraphs max).""",
         )
         return cleaned.strip() or response.strip()
 
-    async def generate_response(
+    def _build_response_prompt(
         self,
         query: str,
         context: List[str],
         session_id: str,
         intent_info: Dict,
         user_profile: Optional[Dict] = None,
-    ) -> str:
-        """
-        Generate a response using Groq Llama with RAG context.
+    ) -> Tuple[str, List[Dict]]:
         """
-        try:
-            history = self.memory.get_context_messages(session_id)
-            history_text = ""
-            if history:
-                history_text = "Recent conversation:\n" + "\n".join(
-                    [
-                        f"{'User' if m['role'] == 'user' else 'Sahay AI'}: {m['content']}"
-                        for m in history[-4:]
-                    ]
-                )
+        Build the RAG answer prompt.
 
-            context_text = (
-                "\n\n".join(context)
-                if context
-                else "No specific scheme information available."
+        Returns:
+            The prompt and the recent history used for response cleanup
+        """
+        history = self.memory.get_context_messages(session_id)
+        history_text = ""
+        if history:
+            history_text = "Recent conversation:\n" + "\n".join(
+                [
+                    f"{'User' if m['role'] == 'user' else 'Sahay AI'}: {m['content']}"
+                    for m in history[-4:]
+                ]
             )
 
-            profile_text = ""
-            if user_profile:
-                profile_parts = []
-                if user_profile.get("state"):
-                    profile_parts.append(f"State: {user_profile['state']}")
-                if user_profile.get("occupation"):
-                    profile_parts.append(f"Occupation: {user_profile['occupation']}")
-                if user_profile.get("income"):
-                    profile_parts.append(f"Annual Income: ₹{user_profile['income']:,}")
-                if profile_parts:
-                    profile_text = "User Profile: " + ", ".join(profile_parts)
+        context = prepare_context(context)
+        context_text = (
+            "\n\n".join(context)
+            if context
+            else "No specific scheme information available."
+        )
+
+        profile_text = ""
+        if user_profile:
+            profile_parts = []
+            if user_profile.get("state"):
+                profile_parts.append(f"State: {user_profile['state']}")
+            if user_profile.get("occupation"):
+                profile_parts.append(f"Occupation: {user_profile['occupation']}")
+            if user_profile.get("income"):
+                profile_parts.append(f"Annual Income: ₹{user_profile['income']:,}")
+            if profile_parts:
+                profile_text = "User Profile: " + ", ".join(profile_parts)
 
-            session = self.memory.get_history(session_id)
-            language = session.get("language", "en") if session else "en"
-            system_prompt = self._get_language_specific_prompt(language)
+        session = self.memory.get_history(session_id)
+        language = session.get("language", "en") if session else "en"
+        system_prompt = self._get_language_specific_prompt(language)
 
-            prompt = f"""{system_prompt}
+        prompt = f"""{system_prompt}
 
 Do not start the answer with greetings or pleasantries unless the user greeted you first.
 
@@ -288,7 +349,23 @@ USER INTENT: {intent_info.get("intent", "general_query")}
 USER QUESTION: {query}
 
 SAHAY AI RESPONSE:"""
+        return prompt, history
 
+    async def generate_response(
+        self,
+        query: str,
+        context: List[str],
+        session_id: str,
+        intent_info: Dict,
+        user_profile: Optional[Dict] = None,
+    ) -> str:
+        """
+        Generate a response using Groq Llama with RAG context.
+        """
+        try:
+            prompt, history = self._build_response_prompt(
+                query, context, session_id, intent_info, user_profile
+            )
             response = await self._call_llm(prompt)
             return self._clean_response_intro(
                 response,
@@ -298,7 +375,136 @@ SAHAY AI RESPONSE:"""
 
         except Exception as e:
             logger.error(f"Response generation error: {e}")
-            return "I apologize, but I encountered an error while processing your question. Please try again."
+            return RESPONSE_ERROR_MESSAGE
+
+    async def generate_response_stream(
+        self,
+        query: str,
+        context: List[str],
+        session_id: str,
+        intent_info: Dict,
+        user_profile: Optional[Dict] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response using Groq Llama with RAG context.
+
+        When the greeting cleanup applies, the first INTRO_HOLD_CHARS
+        characters are held back and cleaned before being released, so the
+        streamed text matches what generate_response would return.
+        """
+        prompt, history = self._build_response_prompt(
+            query, context, session_id, intent_info, user_profile
+        )
+        intent = intent_info.get("intent", "general_query")
+        pending = ""
+        holding = intent != "greeting" and any(
+            m.get("role") == "assistant" for m in history
+        )
+
+        deltas = self._stream_llm(prompt)
+        try:
+            async for delta in deltas:
+                if not holding:
+                    yield delta
+                    continue
+                pending += delta
+                if len(pending) >= INTRO_HOLD_CHARS:
+                    holding = False
+                    trailing = pending[len(pending.rstrip()) :]
+                    cleaned = self._clean_response_intro(pending, intent, history)
+                    yield cleaned + trailing
+        finally:
+            await deltas.aclose()
+
+        if holding and pending:
+            yield self._clean_response_intro(pending, intent, history)
+
+    def _start_turn(
+        self,
+        query: str,
+        language: str,
+        session_id: str,
+        user_profile: Optional[Dict],
+    ):
+        """Record the user message and session preferences for this turn."""
+        if user_profile:
+            self.memory.update_user_profile(session_id, user_profile)
+
+        self.memory.add_message(session_id, "user", query)
+        self.memory.set_language(session_id, language)
+
+    async def _classify_and_retrieve(self, query: str) -> Tuple[Dict, List[Dict]]:
+        """Classify intent and retrieve context for a query."""
+        # Intent classification waits on the Groq API while retrieval is
+        # local embedding + index work, so overlap the two.
+        intent_info, context = await asyncio.gather(
+            self.classify_intent(query),
+            asyncio.to_thread(self.retriever.search, query, top_k=5),
+        )
+        logger.info(f"Intent classified: {intent_info}")
+        return intent_info, context
+
+    async def _finish_turn(
+        self,
+        query: str,
+        session_id: str,
+        intent_info: Dict,
+        context: List[Dict],
+        response: str,
+    ) -> Dict[str, Any]:
+        """Record the assistant reply and build the result payload."""
+        self.memory.add_message(
+            session_id,
+            "assistant",
+            response,
+            {
+                "intent": intent_info.get("intent"),
+                "confidence": intent_info.get("confidence"),
+            },
+        )
+
+        schemes = []
+        for doc in context[:3]:
+            if doc.get("metadata", {}).get("scheme_id"):
+                schemes.append(
+                    {
+                        "id": doc["metadata"]["scheme_id"],
+                        "name": doc["metadata"].get("scheme_name", ""),
+                        "category": doc["metadata"].get("category", ""),
+                        "benefit_summary": doc["metadata"].get(
+                            "benefit_summary", ""
+                        ),
+                        "eligibility_summary": doc["metadata"].get(
+                            "eligibility_summary", ""
+                        ),
+                    }
+                )
+
+        suggested = await self._generate_suggestions(query, intent_info, response)
+
+        return {
+            "response": response,
+            "intent": intent_info.get("intent"),
+            "confidence": intent_info.get("confidence"),
+            "schemes": schemes,
+            "suggested_questions": suggested,
+            "session_id": session_id,
+        }
+
+    @staticmethod
+    def _error_result(session_id: str) -> Dict[str, Any]:
+        """Fallback payload when a query cannot be processed."""
+        return {
+            "response": "I apologize, but I encountered an error. Please try again.",
+            "intent": "error",
+            "confidence": 0,
+            "schemes": [],
+            "suggested_questions": [
+                "What schemes am I eligible for?",
+                "Tell me about PM-KISAN",
+            ],
+            "session_id": session_id,
+        }
 
     async def process(
         self,
@@ -317,16 +523,9 @@ SAHAY AI RESPONSE:"""
             session_id = f"session_{datetime.utcnow().timestamp()}"
 
         try:
-            if user_profile:
-                self.memory.update_user_profile(session_id, user_profile)
-
-            self.memory.add_message(session_id, "user", query)
-            self.memory.set_language(session_id, language)
+            self._start_turn(query, language, session_id, user_profile)
+            intent_info, context = await self._classify_and_retrieve(query)
 
-            intent_info = await self.classify_intent(query)
-            logger.info(f"Intent classified: {intent_info}")
-
-            context = self.retriever.search(query, top_k=5)
             context_texts = [doc.get("content", "") for doc in context]
 
             response = await self.generate_response(
@@ -337,57 +536,75 @@ SAHAY AI RESPONSE:"""
                 user_profile=user_profile or {},
             )
 
-            self.memory.add_message(
-                session_id,
-                "assistant",
-                response,
-                {
-                    "intent": intent_info.get("intent"),
-                    "confidence": intent_info.get("confidence"),
-                },
+            return await self._finish_turn(
+                query, session_id, intent_info, context, response
             )
 
-            schemes = []
-            for doc in context[:3]:
-                if doc.get("metadata", {}).get("scheme_id"):
-                    schemes.append(
-                        {
-                            "id": doc["metadata"]["scheme_id"],
-                            "name": doc["metadata"].get("scheme_name", ""),
-                            "category": doc["metadata"].get("category", ""),
-                            "benefit_summary": doc["metadata"].get(
-                                "benefit_summary", ""
-                            ),
-                            "eligibility_summary": doc["metadata"].get(
-                                "eligibility_summary", ""
-                            ),
-                        }
-                    )
-
-            suggested = await self._generate_suggestions(query, intent_info, response)
-
-            return {
-                "response": response,
-                "intent": intent_info.get("intent"),
-                "confidence": intent_info.get("confidence"),
-                "schemes": schemes,
-                "suggested_questions": suggested,
-                "session_id": session_id,
-            }
-
         except Exception as e:
             logger.error(f"Query processing error: {e}", exc_info=True)
-            return {
-                "response": "I apologize, but I encountered an error. Please try again.",
-                "intent": "error",
-                "confidence": 0,
-                "schemes": [],
-                "suggested_questions": [
-                    "What schemes am I eligible for?",
-                    "Tell me about PM-KISAN",
-                ],
-                "session_id": session_id,
-            }
+            return self._error_result(session_id)
+
+    async def process_stream(
+        self,
+        query: str,
+        language: str = "en",
+        session_id: Optional[str] = None,
+        user_profile: Optional[Dict] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of process().
+
+        Yields ``{"type": "token", "content": ...}`` events while the answer
+        is generated, then one ``{"type": "done", ...}`` event carrying the
+        same payload process() returns.
+
+        Like process(), every turn ends with an assistant reply in memory:
+        the apology when generation fails, or the text streamed so far when
+        the client disconnects before the answer is complete.
+        """
+        if not session_id:
+            session_id = f"session_{datetime.utcnow().timestamp()}"
+
+        intent_info: Dict[str, Any] = {"intent": "error", "confidence": 0}
+        context: List[Dict] = []
+        parts: List[str] = []
+        response: Optional[str] = None
+        deltas = None
+
+        try:
+            self._start_turn(query, language, session_id, user_profile)
+            intent_info, context = await self._classify_and_retrieve(query)
+
+            context_texts = [doc.get("content", "") for doc in context]
+
+            deltas = self.generate_response_stream(
+                query=query,
+                context=context_texts,
+                session_id=session_id,
+                intent_info=intent_info,
+                user_profile=user_profile or {},
+            )
+            async for delta in deltas:
+                parts.append(delta)
+                yield {"type": "token", "content": delta}
+
+            response = "".join(parts).strip()
+
+        except Exception as e:
+            logger.error(f"Query streaming error: {e}", exc_info=True)
+            response = RESPONSE_ERROR_MESSAGE
+
+        finally:
+            if deltas is not None:
+                await deltas.aclose()
+            if response is None:
+                # Consumer went away (GeneratorExit / cancellation) mid-answer
+                response = "".join(parts).strip() or RESPONSE_ERROR_MESSAGE
+            result = await self._finish_turn(
+                query, session_id, intent_info, context, response
+            )
+
+        yield {"type": "done", **result}
 
     async def _generate_suggestions(
         self, query: str, intent_info: Dict, response: str
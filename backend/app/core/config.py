@@ -73,11 +73,36 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("EMBEDDING_MODEL"),
     )
     embedding_dimension: int = 1024
+    # "onnx" runs the embedder on ONNX Runtime (CPU); "torch" uses plain PyTorch
+    embedding_backend: str = "onnx"
+    # "auto" uses CUDA (bf16) when available, otherwise CPU
+    embedding_device: str = "auto"
+    # Prefer the INT8 graph from scripts/quantize_embedder.py when it exists
+    embedding_quantized: bool = True
+    # Kept out of data/ so the ~2GB FP32 export never lands on the persisted
+    # disk that holds Chroma (1GB on Render); it is rebuilt after a redeploy
+    embedding_cache_dir: str = ".cache/models"
+    # Records the arch quantize_embedder.py used. Lives on the persisted disk so
+    # the INT8 graph can be rebuilt identically when the cache above is wiped
+    embedding_quantization_file: str = "data/embedder_quantization.txt"
+    # Token cap per text; 512 covers the 2000-char chunks from ingest_schemes.py
+    embedding_max_seq_length: int = 512
+    # CPU inference threads; 0 = one per core, minus one for the API
+    embedding_num_threads: int = 0
+    # Optional Model2Vec model for query embedding only, built by
+    # scripts/distill_query_embedder.py into the model cache (re-run per deploy)
+    embedding_query_model: str = ""
 
     # Multilingual
     default_language: str = "en"
     enable_translation: bool = True
 
+    # Interaction logging (JSONL, written off the request path). Off by default:
+    # entries hold raw user messages, which can include income, caste and ID
+    # details, and the file has no rotation or retention.
+    enable_interaction_log: bool = False
+    interaction_log_file: str = "logs/interactions.jsonl"
+
     # Rate Limiting
     rate_limit_per_minute: int = 30
     cache_ttl_seconds: int = 3600
@@ -102,6 +127,40 @@ class Settings(BaseSettings):
             persist_path = BACKEND_DIR / persist_path
         return str(persist_path.resolve())
 
+    @property
+    def embedding_cache_path(self) -> str:
+        """Return an absolute path for exported embedding models."""
+        cache_path = Path(self.embedding_cache_dir).expanduser()
+        if not cache_path.is_absolute():
+            cache_path = BACKEND_DIR / cache_path
+        return str(cache_path.resolve())
+
+    @property
+    def embedding_quantization_path(self) -> str:
+        """Return an absolute path for the embedder quantization record."""
+        record_path = Path(self.embedding_quantization_file).expanduser()
+        if not record_path.is_absolute():
+            record_path = BACKEND_DIR / record_path
+        return str(record_path.resolve())
+
+    @property
+    def embedding_query_model_path(self) -> str:
+        """Return the query model as an absolute path, or a Hub id unchanged."""
+        model_path = Path(self.embedding_query_model).expanduser()
+        if not self.embedding_query_model or model_path.is_absolute():
+            return self.embedding_query_model
+        if (BACKEND_DIR / model_path).exists():
+            return str((BACKEND_DIR / model_path).resolve())
+        return self.embedding_query_model
+
+    @property
+    def interaction_log_path(self) -> str:
+        """Return an absolute path for the interaction log file."""
+        log_path = Path(self.interaction_log_file).expanduser()
+        if not log_path.is_absolute():
+            log_path = BACKEND_DIR / log_path
+        return str(log_path.resolve())
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -17,6 +17,18 @@ from chromadb.config import Settings
 
 from app.core.config import get_settings
 
+# HNSW parameters for the scheme collection. Embeddings are L2-normalized,
+# so cosine space ranks the same as inner product. A wider graph (M=32) and
+# larger build/search beams than Chroma's defaults (M=16, search_ef=10) keep
+# recall high as the corpus grows. Build-time values only apply to newly
+# created indexes, so run a reindex after changing them.
+COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
+
 
 class ChromaDBClient:
     """ChromaDB client for storing and retrieving scheme embeddings."""
@@ -42,7 +54,7 @@ class ChromaDBClient:
             )
 
             self.collection = self.client.get_or_create_collection(
-                name=self.collection_name, metadata={"hnsw:space": "cosine"}
+                name=self.collection_name, metadata=COLLECTION_METADATA
             )
         except (sqlite3.OperationalError, KeyError) as exc:
             raise RuntimeError(
@@ -55,7 +67,7 @@ class ChromaDBClient:
     def _create_or_get_collection(self):
         """Refresh the collection handle if it was deleted during a reset/reindex."""
         self.collection = self.client.get_or_create_collection(
-            name=self.collection_name, metadata={"hnsw:space": "cosine"}
+            name=self.collection_name, metadata=COLLECTION_METADATA
         )
         return self.collection
 
@@ -109,11 +121,16 @@ class ChromaDBClient:
         ids: Optional[List[str]] = None,
         where: Optional[Dict] = None,
         limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get vectors by ID or filter."""
         return self._with_collection_retry(
             lambda collection: collection.get(
-                ids=ids, where=where, limit=limit, include=["documents", "metadatas"]
+                ids=ids,
+                where=where,
+                limit=limit,
+                offset=offset,
+                include=["documents", "metadatas"],
             )
         )
 
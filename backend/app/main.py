@@ -52,6 +52,11 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
+    from app.services.voice import close_voice_service
+    from app.whatsapp.client import close_wa_client
+
+    await close_wa_client()
+    close_voice_service()
 
 
 # Create FastAPI application
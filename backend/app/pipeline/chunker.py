@@ -10,13 +10,17 @@ Author: Jagadeep Mamidi
 
 import re
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Sequence
 
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 512
 CHUNK_OVERLAP = 50
 
+# Preferred cut points, strongest first (paragraph, line, sentence, word).
+# "। " is the danda used as a full stop in Hindi and other Indic scripts.
+SEPARATORS = ("\n\n", "\n", ". ", "? ", "! ", "। ", " ")
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text."""
@@ -32,6 +36,59 @@ def split_into_sentences(text: str) -> List[str]:
     return [s.strip() for s in sentences if s.strip()]
 
 
+def split_text(
+    text: str,
+    chunk_size: int = CHUNK_SIZE,
+    chunk_overlap: int = CHUNK_OVERLAP,
+    separators: Sequence[str] = SEPARATORS,
+) -> Iterator[str]:
+    """
+    Split text into overlapping chunks in a single left-to-right pass.
+
+    Each chunk ends at the strongest separator found in the last quarter
+    of its window (falling back to a hard cut at chunk_size), so the text
+    is scanned once instead of being re-split per separator level.
+
+    Args:
+        text: Text to split
+        chunk_size: Maximum chunk size in characters
+        chunk_overlap: Characters repeated at the start of the next chunk
+        separators: Cut points in order of preference
+
+    Yields:
+        Stripped, non-empty chunks
+    """
+    slack = max(1, chunk_size // 4)
+    length = len(text)
+    start = 0
+
+    while start < length:
+        end = min(start + chunk_size, length)
+        if end < length:
+            window_start = max(start + 1, end - slack)
+            for sep in separators:
+                cut = text.rfind(sep, window_start, end)
+                if cut != -1:
+                    end = cut + len(sep)
+                    break
+
+        chunk = text[start:end].strip()
+        if chunk:
+            yield chunk
+
+        if end >= length:
+            break
+
+        # Start the next chunk inside the overlap, on a word boundary
+        next_start = end
+        if chunk_overlap > 0 and end - start > chunk_overlap:
+            next_start = end - chunk_overlap
+            space = text.find(" ", next_start, end)
+            if space != -1:
+                next_start = space + 1
+        start = next_start
+
+
 def chunk_documents(
     documents: List[Dict[str, Any]],
     chunk_size: int = CHUNK_SIZE,
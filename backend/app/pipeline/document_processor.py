@@ -16,6 +16,7 @@ from datetime import datetime
 import hashlib
 
 from app.core.config import get_settings
+from app.pipeline.chunker import split_text
 from app.rag.hybrid_retriever import get_retriever
 
 logger = logging.getLogger(__name__)
@@ -93,15 +94,19 @@ class DocumentProcessor:
                 **(metadata or {})
             }
             
-            # Add chunks to retriever
-            for i, chunk in enumerate(chunks):
-                chunk_id = f"{base_id}_chunk_{i}"
-                chunk_metadata = {
-                    **doc_metadata,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks)
+            # Add chunks to retriever in one batch so they are embedded together
+            self.retriever.add_documents_batch([
+                {
+                    "id": f"{base_id}_chunk_{i}",
+                    "content": chunk,
+                    "metadata": {
+                        **doc_metadata,
+                        "chunk_index": i,
+                        "total_chunks": len(chunks)
+                    }
                 }
-                self.retriever.add_document(chunk_id, chunk, chunk_metadata)
+                for i, chunk in enumerate(chunks)
+            ])
             
             logger.info(f"Processed document: {filename} -> {len(chunks)} chunks")
             
@@ -179,44 +184,9 @@ class DocumentProcessor:
     def _chunk_text(self, text: str) -> List[str]:
         """
         Split text into chunks with overlap for better retrieval.
-        Uses sentence-aware splitting to avoid breaking mid-sentence.
+        Cuts at paragraph/sentence boundaries where possible.
         """
-        # Simple sentence-aware chunking
-        sentences = []
-        current = ""
-        
-        for char in text:
-            current += char
-            if char in ".!?" and len(current) > 50:
-                sentences.append(current.strip())
-                current = ""
-        
-        if current.strip():
-            sentences.append(current.strip())
-        
-        # Combine sentences into chunks
-        chunks = []
-        current_chunk = ""
-        
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) < self.chunk_size:
-                current_chunk += " " + sentence if current_chunk else sentence
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                
-                # Start new chunk with overlap
-                if chunks and self.chunk_overlap > 0:
-                    # Take end of previous chunk for overlap
-                    overlap = chunks[-1][-self.chunk_overlap:]
-                    current_chunk = overlap + " " + sentence
-                else:
-                    current_chunk = sentence
-        
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
-        
-        return chunks
+        return list(split_text(text, self.chunk_size, self.chunk_overlap))
     
     async def process_scheme_data(
         self,
@@ -245,14 +215,18 @@ class DocumentProcessor:
             # Chunk the content
             chunks = self._chunk_text(content)
             
-            for i, chunk in enumerate(chunks):
-                chunk_id = f"{scheme_id}_chunk_{i}"
-                chunk_metadata = {
-                    **metadata,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks)
+            self.retriever.add_documents_batch([
+                {
+                    "id": f"{scheme_id}_chunk_{i}",
+                    "content": chunk,
+                    "metadata": {
+                        **metadata,
+                        "chunk_index": i,
+                        "total_chunks": len(chunks)
+                    }
                 }
-                self.retriever.add_document(chunk_id, chunk, chunk_metadata)
+                for i, chunk in enumerate(chunks)
+            ])
             
             logger.info(f"Added scheme: {scheme_name} -> {len(chunks)} chunks")
             
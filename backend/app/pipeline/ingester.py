@@ -15,6 +15,38 @@ from app.services.embedder import get_embedder
 
 logger = logging.getLogger(__name__)
 
+# Chunk IDs per Chroma lookup when checking for already-ingested chunks
+EXISTING_LOOKUP_SIZE = 1000
+
+
+def _drop_unchanged_chunks(
+    chroma: ChromaDBClient, chunks: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Remove chunks already stored with identical text and metadata.
+
+    Chunk IDs are deterministic, so a re-run over the same datasets finds
+    every unchanged chunk by ID. Metadata includes the embedder
+    fingerprint, so a match also means the stored vector came from the
+    current model; skipping those leaves only new, edited or stale chunks.
+    """
+    changed = []
+    for i in range(0, len(chunks), EXISTING_LOOKUP_SIZE):
+        page = chunks[i : i + EXISTING_LOOKUP_SIZE]
+        stored = chroma.get(ids=[chunk["id"] for chunk in page])
+        existing = {
+            doc_id: (document, metadata)
+            for doc_id, document, metadata in zip(
+                stored["ids"], stored["documents"], stored["metadatas"]
+            )
+        }
+        changed.extend(
+            chunk
+            for chunk in page
+            if existing.get(chunk["id"]) != (chunk["text"], chunk["metadata"])
+        )
+    return changed
+
 
 async def ingest_documents(
     documents: List[Dict[str, Any]], batch_size: int = 96, show_progress: bool = True
@@ -28,7 +60,8 @@ async def ingest_documents(
         show_progress: Show progress bar
 
     Returns:
-        Number of chunks ingested
+        Number of chunks ingested, including unchanged chunks that were
+        already stored and did not need re-embedding
     """
     from app.pipeline.chunker import chunk_documents
 
@@ -37,8 +70,22 @@ async def ingest_documents(
     chroma = get_chroma_client()
     embedder = get_embedder()
 
-    chunks = chunk_documents(documents)
-    logger.info(f"Created {len(chunks)} chunks")
+    all_chunks = chunk_documents(documents)
+    logger.info(f"Created {len(all_chunks)} chunks")
+
+    # Recorded per chunk so vectors from a different embedder are re-embedded
+    for chunk in all_chunks:
+        chunk["metadata"]["embedder"] = embedder.fingerprint
+
+    chunks = _drop_unchanged_chunks(chroma, all_chunks)
+    if len(chunks) < len(all_chunks):
+        logger.info(
+            f"Skipping {len(all_chunks) - len(chunks)} unchanged chunks already stored"
+        )
+
+    # Group similar-length chunks into the same embedding batch so each
+    # batch is padded to a length close to its own texts, not the corpus max
+    chunks.sort(key=lambda chunk: len(chunk["text"]))
 
     total_chunks = len(chunks)
 
@@ -62,8 +109,8 @@ async def ingest_documents(
                 f"Processed {min(i + batch_size, total_chunks)}/{total_chunks} chunks"
             )
 
-    logger.info(f"Successfully ingested {len(chunks)} chunks into ChromaDB")
-    return len(chunks)
+    logger.info(f"Successfully ingested {len(all_chunks)} chunks into ChromaDB")
+    return len(all_chunks)
 
 
 async def ingest_huggingface_dataset(
@@ -121,6 +168,9 @@ async def reindex_collection() -> int:
     """
     Clear and rebuild the entire ChromaDB collection.
 
+    Only the HuggingFace datasets are re-ingested; documents added through
+    /admin/upload or scripts/ingest_schemes.py are deleted.
+
     Returns:
         Number of chunks reindexed
     """
@@ -132,6 +182,47 @@ async def reindex_collection() -> int:
     return await ingest_all_datasets()
 
 
+async def reembed_collection(batch_size: int = 96) -> int:
+    """
+    Replace the vectors of every stored chunk using the current embedder.
+
+    Unlike reindex_collection(), nothing is deleted: chunks added through
+    /admin/upload or scripts/ingest_schemes.py are kept, because Chroma
+    already stores each chunk's text and metadata. Use it after switching
+    model weights (e.g. scripts/quantize_embedder.py).
+
+    Returns:
+        Number of chunks re-embedded
+    """
+    chroma = get_chroma_client()
+    embedder = get_embedder()
+
+    total_chunks = chroma.count()
+    logger.info(f"Re-embedding {total_chunks} stored chunks")
+
+    # Upserting existing IDs updates rows in place, so offsets stay stable
+    for offset in range(0, total_chunks, EXISTING_LOOKUP_SIZE):
+        stored = chroma.get(limit=EXISTING_LOOKUP_SIZE, offset=offset)
+        if not stored["ids"]:
+            break
+
+        metadatas = [dict(metadata or {}) for metadata in stored["metadatas"]]
+        for metadata in metadatas:
+            metadata["embedder"] = embedder.fingerprint
+
+        chroma.upsert(
+            ids=stored["ids"],
+            embeddings=embedder.embed_documents(
+                stored["documents"], batch_size=batch_size
+            ),
+            documents=stored["documents"],
+            metadatas=metadatas,
+        )
+        logger.info(f"Re-embedded {offset + len(stored['ids'])}/{total_chunks} chunks")
+
+    return total_chunks
+
+
 def get_collection_stats() -> Dict[str, Any]:
     """
     Get statistics about the ChromaDB collection.
@@ -0,0 +1,68 @@
+"""
+RAG Context Preparation
+=======================
+
+Cleans retrieved chunks before they are placed in an LLM prompt:
+collapses whitespace, drops duplicates, and trims text repeated
+between overlapping neighbouring chunks so it is not sent twice.
+
+Author: Jagadeep Mamidi
+"""
+
+import re
+from typing import List
+
+# Shortest shared suffix/prefix treated as chunk overlap rather than coincidence
+MIN_OVERLAP = 50
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _overlap_length(left: str, right: str, min_overlap: int = MIN_OVERLAP) -> int:
+    """Length of the longest suffix of `left` that is also a prefix of `right`."""
+    if len(left) < min_overlap or len(right) < min_overlap:
+        return 0
+
+    probe = right[:min_overlap]
+    idx = left.find(probe, max(0, len(left) - len(right)))
+    while idx != -1:
+        tail = left[idx:]
+        if right.startswith(tail):
+            return len(tail)
+        idx = left.find(probe, idx + 1)
+    return 0
+
+
+def prepare_context(chunks: List[str], min_overlap: int = MIN_OVERLAP) -> List[str]:
+    """
+    Normalize retrieved chunks for prompt construction.
+
+    Args:
+        chunks: Retrieved document chunks, best match first
+        min_overlap: Minimum shared characters to trim between chunks
+
+    Returns:
+        Cleaned chunks in the original order, without repeated text
+    """
+    prepared: List[str] = []
+
+    for chunk in chunks:
+        text = _WHITESPACE_RE.sub(" ", chunk or "").strip()
+        if not text or any(text in kept for kept in prepared):
+            continue
+
+        for kept in prepared:
+            # This chunk continues a kept one: drop the repeated lead-in
+            overlap = _overlap_length(kept, text, min_overlap)
+            if overlap:
+                text = text[overlap:].lstrip()
+                continue
+            # This chunk precedes a kept one: drop the repeated tail
+            overlap = _overlap_length(text, kept, min_overlap)
+            if overlap:
+                text = text[:-overlap].rstrip()
+
+        if text:
+            prepared.append(text)
+
+    return prepared
@@ -10,18 +10,33 @@ Author: Jagadeep Mamidi
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from rank_bm25 import BM25Okapi
 
 from app.core.config import get_settings
-from app.db.chroma import get_chroma_client
+from app.db.chroma import COLLECTION_METADATA, get_chroma_client
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# Max distinct queries whose ranked results are kept in memory
+SEARCH_CACHE_SIZE = 1024
+
+# Rows fetched per Chroma read when building the BM25 index at startup
+CHROMA_LOAD_PAGE_SIZE = 1000
+
+
+class _UncacheableSearch(Exception):
+    """Carries results that must not be cached (vector leg degraded)."""
+
+    def __init__(self, results: Tuple[Dict, ...]):
+        super().__init__("search degraded")
+        self.results = results
+
 
 class HybridRetriever:
     """
@@ -39,6 +54,13 @@ class HybridRetriever:
         self.chroma_collection = None
         self._chroma_client = None
 
+        # Per-instance LRU of ranked results, keyed on the index generation so
+        # a search that finishes after an index update cannot serve stale hits
+        self._index_generation = 0
+        self._search_cached = lru_cache(maxsize=SEARCH_CACHE_SIZE)(
+            self._search_uncached
+        )
+
         # Initialize ChromaDB
         self._init_chromadb()
 
@@ -85,19 +107,25 @@ class HybridRetriever:
             self._load_sample_documents()
             return
 
-        # Load all documents from ChromaDB for BM25 index
+        # Load all documents from ChromaDB for BM25 index, one page at a time
+        # so startup never holds a second full copy of the collection in memory
         try:
-            results = self.chroma_collection.get(include=["documents", "metadatas"])
-
-            for i, doc_id in enumerate(results["ids"]):
-                self.documents.append(
-                    {
-                        "id": doc_id,
-                        "content": results["documents"][i],
-                        "metadata": results["metadatas"][i] or {},
-                    }
+            for offset in range(0, count, CHROMA_LOAD_PAGE_SIZE):
+                results = self.chroma_collection.get(
+                    include=["documents", "metadatas"],
+                    limit=CHROMA_LOAD_PAGE_SIZE,
+                    offset=offset,
                 )
 
+                for i, doc_id in enumerate(results["ids"]):
+                    self.documents.append(
+                        {
+                            "id": doc_id,
+                            "content": results["documents"][i],
+                            "metadata": results["metadatas"][i] or {},
+                        }
+                    )
+
             self._append_sample_documents_if_missing()
             self._build_bm25_index()
             logger.info(
@@ -278,6 +306,11 @@ class HybridRetriever:
             logger.error(f"Batch document embedding failed: {e}")
             return []
 
+    def _invalidate_search_cache(self):
+        """Drop cached results once an index update has fully landed."""
+        self._index_generation += 1
+        self._search_cached.cache_clear()
+
     def add_document(self, doc_id: str, content: str, metadata: Dict = None):
         """Add a single document to both BM25 and ChromaDB."""
         doc = {"id": doc_id, "content": content, "metadata": metadata or {}}
@@ -311,6 +344,8 @@ class HybridRetriever:
             except Exception as e:
                 logger.error(f"Failed to add to ChromaDB: {e}")
 
+        self._invalidate_search_cache()
+
     def add_documents_batch(self, documents: List[Dict]):
         """
         Add multiple documents at once (more efficient for bulk ingestion).
@@ -352,6 +387,8 @@ class HybridRetriever:
             except Exception as e:
                 logger.error(f"Batch add to ChromaDB failed: {e}")
 
+        self._invalidate_search_cache()
+
     def search(self, query: str, top_k: int = 5, alpha: float = 0.5) -> List[Dict]:
         """
         Hybrid search combining BM25 and vector search.
@@ -364,17 +401,44 @@ class HybridRetriever:
         Returns:
             List of matching documents, scored and ranked
         """
+        # Repeated queries (suggested questions, retries) are served from the
+        # LRU cache, skipping the query embedding and both index lookups.
+        normalized_query = " ".join(query.split())
+        try:
+            results = self._search_cached(
+                normalized_query, top_k, alpha, self._index_generation
+            )
+        except _UncacheableSearch as degraded:
+            results = degraded.results
+        return [dict(doc) for doc in results]
+
+    def _search_uncached(
+        self, query: str, top_k: int, alpha: float, generation: int
+    ) -> Tuple[Dict, ...]:
+        """
+        Run the hybrid search; results are a tuple so they can be cached.
+
+        `generation` only keys the cache. When the vector leg failed the
+        results are raised as _UncacheableSearch, so a transient embedding
+        or Chroma error does not pin a BM25-only ranking in the cache.
+        """
         bm25_results = self._bm25_search(query, top_k=top_k * 2)
-        vector_results = self._vector_search(query, top_k=top_k * 2)
+        vector_results, vector_ok = self._vector_search(query, top_k=top_k * 2)
 
         # If only one method returned results, use that
         if not vector_results:
-            return bm25_results[:top_k]
-        if not bm25_results:
-            return vector_results[:top_k]
+            results = tuple(bm25_results[:top_k])
+        elif not bm25_results:
+            results = tuple(vector_results[:top_k])
+        else:
+            # Merge and re-rank
+            results = tuple(
+                self._merge_results(bm25_results, vector_results, query, alpha, top_k)
+            )
 
-        # Merge and re-rank
-        return self._merge_results(bm25_results, vector_results, query, alpha, top_k)
+        if not vector_ok:
+            raise _UncacheableSearch(results)
+        return results
 
     def _bm25_search(self, query: str, top_k: int = 10) -> List[Dict]:
         """BM25 keyword search."""
@@ -409,14 +473,21 @@ class HybridRetriever:
         results.sort(key=lambda doc: doc["score"], reverse=True)
         return results
 
-    def _vector_search(self, query: str, top_k: int = 10) -> List[Dict]:
-        """ChromaDB vector similarity search."""
+    def _vector_search(self, query: str, top_k: int = 10) -> Tuple[List[Dict], bool]:
+        """
+        ChromaDB vector similarity search.
+
+        Returns:
+            The matches, and False when the search fell back or failed on a
+            non-empty collection (the results are then not cacheable)
+        """
         self._sync_chroma_collection()
         if not self.chroma_collection or self.chroma_collection.count() == 0:
-            return []
+            return [], True
 
         try:
             # Generate query embedding
+            vector_ok = True
             query_embedding = self._embed_text(query)
 
             if query_embedding:
@@ -427,6 +498,7 @@ class HybridRetriever:
                 )
             else:
                 # Fallback: use ChromaDB's built-in text search
+                vector_ok = False
                 results = self.chroma_collection.query(
                     query_texts=[query],
                     n_results=min(top_k, self.chroma_collection.count()),
@@ -450,11 +522,11 @@ class HybridRetriever:
                         }
                     )
 
-            return output
+            return output, vector_ok
 
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
-            return []
+            return [], False
 
     def _merge_results(
         self,
@@ -516,12 +588,14 @@ class HybridRetriever:
                 # Delete and recreate collection
                 self._chroma_client.delete_collection("sahay_schemes")
                 self.chroma_collection = self._chroma_client.get_or_create_collection(
-                    name="sahay_schemes", metadata={"hnsw:space": "cosine"}
+                    name="sahay_schemes", metadata=COLLECTION_METADATA
                 )
                 logger.info("Cleared all documents from ChromaDB")
             except Exception as e:
                 logger.error(f"Failed to clear ChromaDB: {e}")
 
+        self._invalidate_search_cache()
+
     def get_stats(self) -> Dict:
         """Get retriever statistics."""
         self._sync_chroma_collection()
@@ -539,6 +613,7 @@ class HybridRetriever:
             "mode": "hybrid"
             if self.chroma_collection and chroma_count > 0
             else "bm25_only",
+            "search_cache": self._search_cached.cache_info()._asdict(),
         }
 
 
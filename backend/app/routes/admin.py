@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import uuid4
 
+import aiofiles
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -38,12 +39,16 @@ DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data")
 SCHEMES_DIR = os.path.join(DATA_DIR, "schemes")
 UPLOADS_DIR = os.path.join(DATA_DIR, "uploads")
 
-for dir_path in [DATA_DIR, SCHEMES_DIR, UPLOADS_DIR]:
+# makedirs creates DATA_DIR along the way, so only the leaves are needed
+for dir_path in [SCHEMES_DIR, UPLOADS_DIR]:
     os.makedirs(dir_path, exist_ok=True)
 
 # Max upload size: 10MB
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024
 
+# Uploads are copied to disk in 1MB reads, one write per read
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 # ==================== Models ====================
 
@@ -120,20 +125,24 @@ async def upload_document(
             400, f"Unsupported file type: {ext}. Allowed: {allowed_types}"
         )
 
-    # Validate file size
-    content = await file.read()
-    if len(content) > MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            400, f"File too large. Max size: {MAX_UPLOAD_SIZE // (1024 * 1024)}MB"
-        )
-
-    # Save file
+    # Save file, enforcing the size limit while streaming it to disk
     doc_id = str(uuid4())[:8]
     safe_filename = f"{doc_id}_{file.filename}"
     file_path = os.path.join(UPLOADS_DIR, safe_filename)
 
-    with open(file_path, "wb") as f:
-        f.write(content)
+    size = 0
+    async with aiofiles.open(file_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_UPLOAD_SIZE:
+                break
+            await f.write(chunk)
+
+    if size > MAX_UPLOAD_SIZE:
+        os.remove(file_path)
+        raise HTTPException(
+            400, f"File too large. Max size: {MAX_UPLOAD_SIZE // (1024 * 1024)}MB"
+        )
 
     # Create job
     job_id = str(uuid4())[:12]
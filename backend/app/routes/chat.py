@@ -8,11 +8,14 @@ Uses Groq Llama 3.3 for fast inference.
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import List, Optional
 from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.agents.orchestrator import get_orchestrator
@@ -23,6 +26,23 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _ndjson(event: dict) -> bytes:
+    """Serialize one stream event as an NDJSON line."""
+    return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _log_interaction(**fields) -> None:
+    """Queue a chat interaction for the JSONL log; never fails the request."""
+    if not settings.enable_interaction_log:
+        return
+    try:
+        from app.services.interaction_log import get_interaction_logger
+
+        get_interaction_logger().log_interaction(**fields)
+    except Exception as e:
+        logger.warning(f"Could not log interaction: {e}")
+
+
 def _translate_text(lang_agent, text: str, target_lang: str) -> str:
     """Translate helper that leaves empty/English text untouched on failure."""
     if not text or target_lang == "en":
@@ -122,6 +142,101 @@ class FeedbackRequest(BaseModel):
     helpful: Optional[bool] = None
 
 
+# ==================== Helpers ====================
+
+
+def _resolve_language(request: ChatRequest) -> str:
+    """Detect the request language when set to auto; default to English."""
+    detected_lang = request.language
+    if request.language == "auto":
+        from app.agents.language_agent import get_language_agent
+
+        lang_agent = get_language_agent()
+        detected_lang = lang_agent.detect_language(request.message)
+
+    if detected_lang not in SUPPORTED_LANGUAGES:
+        detected_lang = "en"
+    return detected_lang
+
+
+def _build_chat_response(
+    request: ChatRequest,
+    result: dict,
+    detected_lang: str,
+    session_id: str,
+    start_time: float,
+    **log_fields,
+) -> ChatResponse:
+    """Translate orchestrator output into a ChatResponse and log the turn."""
+    lang_agent = None
+    if detected_lang != "en":
+        from app.agents.language_agent import get_language_agent
+
+        lang_agent = get_language_agent()
+
+    scheme_cards = None
+    if result.get("schemes"):
+        scheme_cards = [
+            SchemeCard(
+                id=s.get("id", ""),
+                name=_translate_text(lang_agent, s.get("name", ""), detected_lang),
+                category=_translate_text(
+                    lang_agent, s.get("category", ""), detected_lang
+                ),
+                benefit_summary=_translate_text(
+                    lang_agent, s.get("benefit_summary", ""), detected_lang
+                ),
+                eligibility_summary=_translate_text(
+                    lang_agent, s.get("eligibility_summary", ""), detected_lang
+                ),
+                apply_url=s.get("apply_url"),
+            )
+            for s in result["schemes"][:5]
+        ]
+
+    suggested_questions = result.get(
+        "suggested_questions",
+        [
+            "What documents do I need?",
+            "How do I apply online?",
+            "What is the benefit amount?",
+        ],
+    )
+    if detected_lang != "en":
+        suggested_questions = [
+            _translate_text(lang_agent, question, detected_lang)
+            for question in suggested_questions
+        ]
+
+    response_text = result.get(
+        "response", "I apologize, I couldn't process your request."
+    )
+    _log_interaction(
+        session_id=result.get("session_id", session_id),
+        language=detected_lang,
+        query=request.message,
+        response=response_text,
+        intent=result.get("intent"),
+        confidence=result.get("confidence"),
+        scheme_ids=[s.get("id", "") for s in result.get("schemes") or []],
+        latency_ms=round((time.perf_counter() - start_time) * 1000, 1),
+        **log_fields,
+    )
+
+    return ChatResponse(
+        success=True,
+        message=response_text,
+        session_id=result.get("session_id", session_id),
+        detected_language=detected_lang,
+        response_language=detected_lang,
+        intent=result.get("intent"),
+        confidence=result.get("confidence"),
+        schemes=scheme_cards,
+        suggested_questions=suggested_questions,
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
 # ==================== Endpoints ====================
 
 
@@ -135,18 +250,10 @@ async def send_message(request: ChatRequest):
     and respond in the same language using Groq Llama 3.3.
     """
     try:
+        start_time = time.perf_counter()
         session_id = request.session_id or str(uuid4())
         orchestrator = get_orchestrator()
-
-        detected_lang = request.language
-        if request.language == "auto":
-            from app.agents.language_agent import LanguageAgent
-
-            lang_agent = LanguageAgent()
-            detected_lang = lang_agent.detect_language(request.message)
-
-        if detected_lang not in SUPPORTED_LANGUAGES:
-            detected_lang = "en"
+        detected_lang = _resolve_language(request)
 
         result = await orchestrator.process(
             query=request.message,
@@ -155,59 +262,8 @@ async def send_message(request: ChatRequest):
             user_profile=request.user_profile,
         )
 
-        lang_agent = None
-        if detected_lang != "en":
-            from app.agents.language_agent import LanguageAgent
-
-            lang_agent = LanguageAgent()
-
-        scheme_cards = None
-        if result.get("schemes"):
-            scheme_cards = [
-                SchemeCard(
-                    id=s.get("id", ""),
-                    name=_translate_text(lang_agent, s.get("name", ""), detected_lang),
-                    category=_translate_text(
-                        lang_agent, s.get("category", ""), detected_lang
-                    ),
-                    benefit_summary=_translate_text(
-                        lang_agent, s.get("benefit_summary", ""), detected_lang
-                    ),
-                    eligibility_summary=_translate_text(
-                        lang_agent, s.get("eligibility_summary", ""), detected_lang
-                    ),
-                    apply_url=s.get("apply_url"),
-                )
-                for s in result["schemes"][:5]
-            ]
-
-        suggested_questions = result.get(
-            "suggested_questions",
-            [
-                "What documents do I need?",
-                "How do I apply online?",
-                "What is the benefit amount?",
-            ],
-        )
-        if detected_lang != "en":
-            suggested_questions = [
-                _translate_text(lang_agent, question, detected_lang)
-                for question in suggested_questions
-            ]
-
-        return ChatResponse(
-            success=True,
-            message=result.get(
-                "response", "I apologize, I couldn't process your request."
-            ),
-            session_id=result.get("session_id", session_id),
-            detected_language=detected_lang,
-            response_language=detected_lang,
-            intent=result.get("intent"),
-            confidence=result.get("confidence"),
-            schemes=scheme_cards,
-            suggested_questions=suggested_questions,
-            timestamp=datetime.utcnow().isoformat(),
+        return _build_chat_response(
+            request, result, detected_lang, session_id, start_time
         )
 
     except Exception as e:
@@ -215,6 +271,64 @@ async def send_message(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/stream")
+async def stream_message(request: ChatRequest):
+    """
+    Send a message and stream the response as newline-delimited JSON.
+
+    Emits ``{"type": "token", "content": ...}`` events as the answer is
+    generated, then a single ``{"type": "done", ...}`` event with the same
+    fields as ``POST /chat``. Failures after streaming has started are
+    reported as ``{"type": "error", "detail": ...}``.
+    """
+    try:
+        start_time = time.perf_counter()
+        session_id = request.session_id or str(uuid4())
+        orchestrator = get_orchestrator()
+        detected_lang = _resolve_language(request)
+    except Exception as e:
+        logger.error(f"Chat stream error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def events():
+        first_token_ms = None
+        stream = orchestrator.process_stream(
+            query=request.message,
+            language=detected_lang,
+            session_id=session_id,
+            user_profile=request.user_profile,
+        )
+        try:
+            async for event in stream:
+                if event["type"] == "token":
+                    if first_token_ms is None:
+                        first_token_ms = round(
+                            (time.perf_counter() - start_time) * 1000, 1
+                        )
+                    yield _ndjson(event)
+                    continue
+
+                response = _build_chat_response(
+                    request,
+                    event,
+                    detected_lang,
+                    session_id,
+                    start_time,
+                    first_token_ms=first_token_ms,
+                )
+                yield _ndjson({"type": "done", **response.model_dump()})
+
+        except Exception as e:
+            logger.error(f"Chat stream error: {e}", exc_info=True)
+            yield _ndjson({"type": "error", "detail": str(e)})
+        finally:
+            # On client disconnect, lets process_stream record the turn and
+            # close the LLM stream now rather than at garbage collection
+            await stream.aclose()
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @router.get("/history/{session_id}", response_model=ConversationHistory)
 async def get_chat_history(session_id: str):
     """
@@ -61,11 +61,11 @@ async def readiness_check():
 
     # Check LLM (Groq)
     try:
-        from groq import Groq
+        from app.services.llm import get_llm_service
 
         if settings.groq_api_key:
-            # Just instantiate client to verify key is set; avoids a live API call
-            Groq(api_key=settings.groq_api_key)
+            # Reuse the shared client to verify the key is set; avoids a live API call
+            get_llm_service()
             services["llm"] = "ok"
         else:
             services["llm"] = "not configured"
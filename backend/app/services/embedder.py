@@ -4,11 +4,16 @@ Sahay AI - Embedder Service
 
 Multilingual embedding generation using sentence-transformers.
 Uses multilingual-e5-large for strong cross-lingual recall.
+Runs on ONNX Runtime by default for faster CPU inference.
 
 Author: Jagadeep Mamidi
 """
 
 import logging
+import os
+import shutil
+import threading
+from pathlib import Path
 from typing import List, Optional
 
 from sentence_transformers import SentenceTransformer
@@ -17,6 +22,66 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+ONNX_FILE_NAME = "onnx/model.onnx"
+QUANTIZED_ONNX_FILE_NAME = "onnx/model_quantized.onnx"
+
+# Target CPU instruction sets supported by optimum's AutoQuantizationConfig
+QUANTIZATION_ARCHS = ("avx512_vnni", "avx512", "avx2", "arm64")
+
+_torch_threads_configured = False
+
+
+def _cpu_thread_count() -> int:
+    """Intra-op threads for CPU inference (0 in settings means auto)."""
+    configured = get_settings().embedding_num_threads
+    if configured > 0:
+        return configured
+    # Leave one core for the event loop and request handling
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def quantize_onnx_model(model: SentenceTransformer, local_dir: Path, arch: str) -> None:
+    """Write a dynamic INT8 copy of an ONNX model's graph into ``local_dir``."""
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    quantization_config = getattr(AutoQuantizationConfig, arch)(is_static=False)
+    export_dynamic_quantized_onnx_model(
+        model, quantization_config, str(local_dir), file_suffix="quantized"
+    )
+
+
+def recorded_quantization_arch() -> Optional[str]:
+    """Arch recorded by scripts/quantize_embedder.py, or None if never run."""
+    record = Path(get_settings().embedding_quantization_path)
+    if not record.exists():
+        return None
+    arch = record.read_text().strip()
+    return arch if arch in QUANTIZATION_ARCHS else None
+
+
+def _configure_torch_threads() -> None:
+    """
+    Size PyTorch's CPU thread pools once per process.
+
+    encode() runs one large op graph per batch, so all cores go to
+    intra-op parallelism and a single inter-op thread avoids
+    oversubscription.
+    """
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    _torch_threads_configured = True
+
+    import torch
+
+    torch.set_num_threads(_cpu_thread_count())
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set before any inter-op parallel work has started
+        logger.debug("torch inter-op threads already initialized")
+
 
 class EmbedderService:
     """
@@ -33,12 +98,181 @@ class EmbedderService:
     def __init__(self, model_name: str = None):
         settings = get_settings()
         self.model_name = model_name or settings.embedding_model
+        self.device = self._resolve_device(settings.embedding_device)
+        # The ONNX export targets CPU; accelerators run the PyTorch model
+        self.backend = settings.embedding_backend if self.device == "cpu" else "torch"
+        self.quantized = settings.embedding_quantized
+        self.cache_dir = Path(settings.embedding_cache_path)
+        # Weights actually loaded (ONNX file or torch dtype); set by _load_model
+        self.variant = "fp32"
 
-        logger.info(f"Loading embedding model: {self.model_name}")
-        self.model = SentenceTransformer(self.model_name)
+        logger.info(
+            f"Loading embedding model: {self.model_name} "
+            f"(backend: {self.backend}, device: {self.device})"
+        )
+        self.model = self._load_model()
+        # Texts are padded to the longest one in each batch, so capping the
+        # length bounds the worst-case batch cost without touching short inputs
+        self.model.max_seq_length = settings.embedding_max_seq_length
         logger.info(
             f"Model loaded. Dimension: {self.model.get_sentence_embedding_dimension()}"
         )
+        self.query_model = self._load_query_model(settings.embedding_query_model_path)
+
+    @staticmethod
+    def _resolve_device(device: str) -> str:
+        """Pick CUDA when available for 'auto', otherwise use the given device."""
+        if device != "auto":
+            return device
+
+        import torch
+
+        return "cuda" if torch.cuda.is_available() else "cpu"
+
+    def _load_model(self) -> SentenceTransformer:
+        """
+        Load the sentence-transformers model on the configured backend.
+
+        With the ONNX backend the exported graph is saved under
+        ``embedding_cache_dir`` on first load, so later startups load it
+        directly instead of re-exporting from the PyTorch weights. If
+        ``scripts/quantize_embedder.py`` has produced an INT8 graph, that
+        one is preferred.
+        """
+        if self.device.startswith("cuda"):
+            return self._load_cuda_model()
+
+        if self.backend != "onnx":
+            _configure_torch_threads()
+            return SentenceTransformer(self.model_name, device=self.device)
+
+        import onnxruntime as ort
+
+        session_options = ort.SessionOptions()
+        session_options.intra_op_num_threads = _cpu_thread_count()
+        session_options.inter_op_num_threads = 1
+
+        file_name = ONNX_FILE_NAME
+        quantized_path = self.local_model_dir / QUANTIZED_ONNX_FILE_NAME
+        if self.quantized and not quantized_path.exists():
+            self._restore_quantized_model(session_options)
+
+        if self.quantized and quantized_path.exists():
+            file_name = QUANTIZED_ONNX_FILE_NAME
+            logger.info("Using INT8-quantized ONNX embedding model")
+        self.variant = file_name
+
+        return self._load_onnx_model(file_name, session_options)
+
+    def _load_onnx_model(self, file_name: str, session_options) -> SentenceTransformer:
+        """Load an ONNX graph from the local cache, exporting and caching it first."""
+        local_dir = self.local_model_dir
+        model_kwargs = {
+            "provider": "CPUExecutionProvider",
+            "file_name": file_name,
+            "session_options": session_options,
+        }
+
+        if (local_dir / file_name).exists():
+            return SentenceTransformer(
+                str(local_dir), backend="onnx", model_kwargs=model_kwargs
+            )
+
+        model = SentenceTransformer(
+            self.model_name, backend="onnx", model_kwargs=model_kwargs
+        )
+        try:
+            model.save_pretrained(str(local_dir))
+            logger.info(f"Cached ONNX embedding model at {local_dir}")
+        except Exception as e:
+            # The exported model is already loaded; only the next startup
+            # loses the shortcut. Drop the partial copy so it is not loaded.
+            logger.warning(f"Could not cache ONNX model at {local_dir}: {e}")
+            shutil.rmtree(local_dir, ignore_errors=True)
+        return model
+
+    def _restore_quantized_model(self, session_options) -> None:
+        """
+        Rebuild a quantized graph that was lost with the model cache.
+
+        The cache is not persisted, so a redeploy drops the INT8 graph while
+        the index still holds INT8 passage vectors. Dynamic quantization of
+        the same export is deterministic, so re-running it with the recorded
+        arch restores matching query embeddings.
+        """
+        arch = recorded_quantization_arch()
+        if arch is None:
+            return
+
+        logger.warning(
+            f"INT8 embedding graph missing from {self.local_model_dir}; "
+            f"re-quantizing for {arch} to match the stored passages"
+        )
+        try:
+            fp32_model = self._load_onnx_model(ONNX_FILE_NAME, session_options)
+            quantize_onnx_model(fp32_model, self.local_model_dir, arch)
+        except Exception as e:
+            logger.warning(
+                f"Could not re-quantize the embedding model: {e}. Queries use "
+                "FP32 weights and no longer match the INT8 passages until it "
+                "is rebuilt with scripts/quantize_embedder.py"
+            )
+
+    def _load_cuda_model(self) -> SentenceTransformer:
+        """
+        Load the PyTorch model on GPU in bfloat16.
+
+        Half-precision weights halve memory traffic in the forward pass;
+        encode() still returns float32 arrays, so Chroma is unaffected.
+        GPUs without bf16 support fall back to float16.
+        """
+        import torch
+
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        logger.info(f"Using {dtype} embedding weights on {self.device}")
+        self.variant = str(dtype).replace("torch.", "")
+        return SentenceTransformer(
+            self.model_name, device=self.device, model_kwargs={"torch_dtype": dtype}
+        )
+
+    def _load_query_model(self, model_path: str) -> Optional[SentenceTransformer]:
+        """
+        Load the optional Model2Vec static model used for queries only.
+
+        Documents are always embedded with the main model. A static model
+        distilled from it without PCA keeps the same output dimension, so
+        query vectors can still be compared against the stored passages.
+        """
+        if not model_path:
+            return None
+
+        try:
+            from sentence_transformers.models import StaticEmbedding
+
+            static = StaticEmbedding.from_model2vec(model_path)
+        except ImportError:
+            logger.warning("model2vec package not installed. Using main query model.")
+            return None
+        except Exception as e:
+            # Typically a path wiped with the model cache by a redeploy, which
+            # then reaches the Hub as an unknown model id
+            logger.warning(
+                f"Could not load query model {model_path}: {e}. "
+                "Using main query model."
+            )
+            return None
+
+        query_model = SentenceTransformer(modules=[static], device="cpu")
+        if query_model.get_sentence_embedding_dimension() != self.dimension:
+            logger.warning(
+                f"Query model {model_path} has dimension "
+                f"{query_model.get_sentence_embedding_dimension()}, expected "
+                f"{self.dimension}. Using main query model."
+            )
+            return None
+
+        logger.info(f"Using static query embeddings from {model_path}")
+        return query_model
 
     def embed_documents(
         self, texts: List[str], batch_size: int = 96
@@ -72,7 +306,8 @@ class EmbedderService:
             Query embedding vector (1024 dimensions)
         """
         prefixed = f"query: {query}"
-        embedding = self.model.encode(
+        model = self.query_model or self.model
+        embedding = model.encode(
             prefixed, normalize_embeddings=True, show_progress_bar=False
         )
         return embedding.tolist()
@@ -105,6 +340,21 @@ class EmbedderService:
         )
         return embeddings.tolist()
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        Identifies the weights behind passage vectors.
+
+        Stored with each ingested chunk, so changing the model, backend,
+        quantization or dtype makes existing chunks count as changed.
+        """
+        return f"{self.model_name}|{self.backend}|{self.variant}"
+
+    @property
+    def local_model_dir(self) -> Path:
+        """Directory holding the exported ONNX model for this embedder."""
+        return self.cache_dir / self.model_name.replace("/", "__")
+
     @property
     def dimension(self) -> int:
         """Get embedding dimension."""
@@ -117,11 +367,20 @@ class EmbedderService:
 
 
 _embedder_service: Optional[EmbedderService] = None
+_embedder_lock = threading.Lock()
 
 
 def get_embedder() -> EmbedderService:
-    """Get or create singleton embedder service."""
+    """
+    Get or create singleton embedder service.
+
+    Searches run in worker threads, so a burst of cold-start requests can
+    reach this at once; the lock makes sure only one of them loads (and
+    possibly exports) the model.
+    """
     global _embedder_service
     if _embedder_service is None:
-        _embedder_service = EmbedderService()
+        with _embedder_lock:
+            if _embedder_service is None:
+                _embedder_service = EmbedderService()
     return _embedder_service
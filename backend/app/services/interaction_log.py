@@ -0,0 +1,161 @@
+"""
+Sahay AI - Interaction Log
+==========================
+
+Append-only JSONL log of chat interactions for offline analysis.
+Writes happen on a background thread so the request path never waits
+on disk I/O.
+
+Author: Jagadeep Mamidi
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Sentinel that tells the writer thread to drain and exit
+_STOP = object()
+
+# Entries waiting for the writer; beyond this new entries are dropped
+MAX_PENDING_ENTRIES = 10_000
+
+# Timestamps are serialized natively by orjson as ISO 8601 with a "Z" suffix;
+# orjson also writes the line terminator, so each record is a single bytes
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+
+
+class InteractionLogger:
+    """
+    Buffered JSONL writer for chat interactions.
+
+    `log_interaction` only enqueues the entry. A single daemon thread
+    drains the queue and writes up to `batch_size` entries per write
+    call, so bursts of traffic are coalesced instead of costing one
+    write per request.
+
+    If the log file cannot be opened the logger disables itself, and if
+    the writer falls behind by MAX_PENDING_ENTRIES new entries are
+    dropped, so a broken disk never grows memory or slows requests.
+    """
+
+    def __init__(self, log_path: Optional[str] = None, batch_size: int = 100):
+        settings = get_settings()
+        self.log_path = log_path or settings.interaction_log_path
+        self.batch_size = batch_size
+        self.dropped = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=MAX_PENDING_ENTRIES)
+        self._worker: Optional[threading.Thread] = None
+
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            self._fd = os.open(
+                self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        except OSError as e:
+            logger.error(f"Interaction log disabled, cannot open {self.log_path}: {e}")
+            return
+
+        self._worker = threading.Thread(
+            target=self._run, name="interaction-log-writer", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.close)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are currently being written."""
+        return self._worker is not None and self._worker.is_alive()
+
+    def log_interaction(self, **fields: Any) -> None:
+        """Queue an interaction entry; returns immediately."""
+        if not self.enabled:
+            return
+        entry = {"timestamp": datetime.now(timezone.utc), **fields}
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    f"Interaction log backlog full; dropped {self.dropped} entries"
+                )
+
+    def _next_batch(self) -> List[Any]:
+        """Block for one entry, then take whatever else is already queued."""
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size and batch[-1] is not _STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        """os.write until every byte is on disk (writes may be partial)."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    def _run(self):
+        """
+        Writer loop: one write call per drained batch.
+
+        The payload is already bytes, so it goes straight to an O_APPEND
+        descriptor instead of through a buffered file object. O_APPEND
+        also keeps each batch contiguous when several workers share a log.
+        """
+        fd = self._fd
+        try:
+            while True:
+                batch = self._next_batch()
+                stop = batch[-1] is _STOP
+                entries: List[Dict] = [e for e in batch if e is not _STOP]
+
+                if entries:
+                    try:
+                        self._write_all(
+                            fd,
+                            b"".join(
+                                orjson.dumps(e, default=str, option=_ORJSON_OPTIONS)
+                                for e in entries
+                            ),
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to write interaction log: {e}")
+
+                if stop:
+                    return
+        finally:
+            os.close(fd)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending entries and stop the writer thread."""
+        if self.enabled:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                return
+            self._worker.join(timeout=timeout)
+
+
+_interaction_logger: Optional[InteractionLogger] = None
+
+
+def get_interaction_logger() -> InteractionLogger:
+    """Get or create singleton interaction logger."""
+    global _interaction_logger
+    if _interaction_logger is None:
+        _interaction_logger = InteractionLogger()
+    return _interaction_logger
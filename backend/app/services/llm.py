@@ -9,14 +9,24 @@ Author: Jagadeep Mamidi
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from groq import Groq
 from tenacity import retry, stop_after_attempt, wait_exponential
 from tenacity.retry import retry_if_exception_type
 from app.core.config import get_settings
+from app.rag.context import prepare_context
 
 logger = logging.getLogger(__name__)
 
+RESPONSE_LANGUAGE_NAMES = {
+    "te": "Telugu",
+    "hi": "Hindi",
+    "en": "English",
+    "ta": "Tamil",
+    "kn": "Kannada",
+    "or": "Odia"
+}
+
 
 class LLMService:
     """
@@ -71,6 +81,50 @@ class LLMService:
         
         return response.choices[0].message.content
     
+    def complete_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1024
+    ) -> Iterator[str]:
+        """
+        Stream a completion from the LLM as text deltas.
+        
+        Not retried: a retry after deltas were yielded would repeat them.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+            temperature: Creativity (0-1)
+            max_tokens: Max response length
+            
+        Yields:
+            Generated text fragments in order
+        """
+        messages = []
+        
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        
+        messages.append({"role": "user", "content": prompt})
+        
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Release the HTTP connection if the caller stops early
+            stream.close()
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30)
@@ -118,21 +172,14 @@ class LLMService:
         Returns:
             Generated response
         """
-        lang_map = {
-            "te": "Telugu",
-            "hi": "Hindi",
-            "en": "English",
-            "ta": "Tamil",
-            "kn": "Kannada",
-            "or": "Odia"
-        }
-        lang_name = lang_map.get(language, "English")
+        lang_name = RESPONSE_LANGUAGE_NAMES.get(language, "English")
         
         system_prompt = f"""You are Sahay AI, a helpful assistant that helps Indian citizens 
         find government welfare schemes. Answer questions based on the provided context.
         Always respond in {lang_name} language unless the user writes in English.
         Keep responses concise and informative."""
         
+        context = prepare_context(context)
         context_text = "\n\n".join([f"[Document {i+1}]: {doc}" for i, doc in enumerate(context)])
         
         prompt = f"""Based on the following information about government schemes, 
@@ -60,6 +60,8 @@ class VoiceService:
 
         self.groq_client = Groq(api_key=settings.groq_api_key)
         self.groq_whisper_model = settings.groq_whisper_model
+        # Reused across Sarvam HTTP fallback calls to keep the connection warm
+        self.http_client = httpx.Client(timeout=30.0)
 
         self._init_sarvam()
 
@@ -141,19 +143,18 @@ class VoiceService:
             wait=wait_exponential(multiplier=1, min=2, max=10),
         )
         def _call():
-            with httpx.Client(timeout=30.0) as client:
-                files = {"file": ("audio.webm", audio_bytes, "audio/webm")}
-                data = {"model": self.sarvam_stt_model, "language_code": language_code}
-                headers = {"api-subscription-key": self.sarvam_api_key}
-
-                response = client.post(
-                    "https://api.sarvam.ai/speech-to-text",
-                    files=files,
-                    data=data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return response.json()
+            files = {"file": ("audio.webm", audio_bytes, "audio/webm")}
+            data = {"model": self.sarvam_stt_model, "language_code": language_code}
+            headers = {"api-subscription-key": self.sarvam_api_key}
+
+            response = self.http_client.post(
+                "https://api.sarvam.ai/speech-to-text",
+                files=files,
+                data=data,
+                headers=headers,
+            )
+            response.raise_for_status()
+            return response.json()
 
         result = _call()
         return result.get("transcript", "")
@@ -279,6 +280,10 @@ class VoiceService:
             return response.translated_text
         return str(response)
 
+    def close(self):
+        """Close the shared Sarvam HTTP connection pool."""
+        self.http_client.close()
+
 
 _voice_service: Optional[VoiceService] = None
 
@@ -289,3 +294,11 @@ def get_voice_service() -> VoiceService:
     if _voice_service is None:
         _voice_service = VoiceService()
     return _voice_service
+
+
+def close_voice_service():
+    """Close the singleton voice service if it was created (app shutdown)."""
+    global _voice_service
+    if _voice_service is not None:
+        _voice_service.close()
+        _voice_service = None
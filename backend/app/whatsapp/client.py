@@ -33,6 +33,8 @@ class WhatsAppClient:
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
         }
+        # Shared for the process lifetime so Graph API calls reuse connections
+        self.http = httpx.AsyncClient(timeout=30.0)
     
     async def send_text_message(self, to: str, message: str) -> Dict[str, Any]:
         """
@@ -56,14 +58,13 @@ class WhatsAppClient:
             }
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                url,
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.post(
+            url,
+            headers=self.headers,
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def upload_media(
         self, media_bytes: bytes, mime_type: str = "audio/mpeg"
@@ -81,17 +82,17 @@ class WhatsAppClient:
         url = f"{self.base_url}/{self.phone_number_id}/media"
 
         # Media upload uses multipart/form-data, not JSON
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url,
-                headers={"Authorization": f"Bearer {self.access_token}"},
-                data={"messaging_product": "whatsapp", "type": mime_type},
-                files={"file": ("audio.mp3", media_bytes, mime_type)},
-            )
-            response.raise_for_status()
-            media_id = response.json().get("id")
-            logger.info(f"Uploaded media, id={media_id}")
-            return media_id
+        response = await self.http.post(
+            url,
+            headers={"Authorization": f"Bearer {self.access_token}"},
+            data={"messaging_product": "whatsapp", "type": mime_type},
+            files={"file": ("audio.mp3", media_bytes, mime_type)},
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        media_id = response.json().get("id")
+        logger.info(f"Uploaded media, id={media_id}")
+        return media_id
 
     async def send_audio_message(
         self,
@@ -128,14 +129,13 @@ class WhatsAppClient:
             "audio": audio_payload,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                url,
-                headers=self.headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.post(
+            url,
+            headers=self.headers,
+            json=payload,
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def send_interactive_buttons(
         self,
@@ -180,14 +180,13 @@ class WhatsAppClient:
             }
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                url,
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.post(
+            url,
+            headers=self.headers,
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def send_reaction(self, to: str, message_id: str, emoji: str = "👍") -> Dict[str, Any]:
         """
@@ -213,14 +212,13 @@ class WhatsAppClient:
             }
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                url,
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.post(
+            url,
+            headers=self.headers,
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def mark_as_read(self, message_id: str) -> Dict[str, Any]:
         """
@@ -240,14 +238,17 @@ class WhatsAppClient:
             "message_id": message_id
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                url,
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.post(
+            url,
+            headers=self.headers,
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self):
+        """Close the shared HTTP connection pool."""
+        await self.http.aclose()
 
 
 _wa_client: Optional[WhatsAppClient] = None
@@ -259,3 +260,11 @@ def get_wa_client() -> WhatsAppClient:
     if _wa_client is None:
         _wa_client = WhatsAppClient()
     return _wa_client
+
+
+async def close_wa_client():
+    """Close the singleton WhatsApp client if it was created (app shutdown)."""
+    global _wa_client
+    if _wa_client is not None:
+        await _wa_client.aclose()
+        _wa_client = None
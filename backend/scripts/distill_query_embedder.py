@@ -0,0 +1,69 @@
+"""
+Sahay AI - Query Embedder Distillation Script
+=============================================
+
+One-time script that distills the embedding model into a Model2Vec
+static model for query embedding. Static embeddings are a token lookup
+plus mean pooling, so queries embed in well under a millisecond on CPU.
+
+PCA is disabled so the distilled model keeps the teacher's dimension;
+ingestion and the stored vectors are unchanged. Check retrieval quality
+on your own queries before enabling it:
+
+    EMBEDDING_QUERY_MODEL=.cache/models/<model>__model2vec
+
+The output goes to the model cache, which is not persisted: without PCA
+the model is about as large as the persisted disk itself. Re-run this
+script after each deploy; until then the embedder logs a warning and
+embeds queries with the main model.
+
+Usage:
+    pip install model2vec[distill]
+    python scripts/distill_query_embedder.py
+
+Author: Jagadeep Mamidi
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Distill the configured embedding model into a static query model."""
+    from model2vec.distill import distill
+
+    from app.core.config import BACKEND_DIR, get_settings
+
+    settings = get_settings()
+    output_dir = (
+        Path(settings.embedding_cache_path)
+        / f"{settings.embedding_model.replace('/', '__')}__model2vec"
+    )
+
+    if output_dir.exists():
+        logger.info(f"Distilled model already exists in {output_dir}. Nothing to do.")
+        return
+
+    logger.info(f"Distilling {settings.embedding_model} (no PCA)...")
+    model = distill(model_name=settings.embedding_model, pca_dims=None)
+    model.save_pretrained(str(output_dir))
+
+    try:
+        env_value = output_dir.relative_to(BACKEND_DIR)
+    except ValueError:
+        env_value = output_dir
+    logger.info(f"Saved distilled model to {output_dir}")
+    logger.info(f"Enable it with EMBEDDING_QUERY_MODEL={env_value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,19 @@ Sahay AI - Data Ingestion Script
 
 Standalone script to download and ingest scheme data into ChromaDB.
 
+Re-running it against a populated collection is incremental: chunks
+already stored with the same text and embedder are skipped, so only new,
+edited or re-embedded chunks cost embedding time.
+
+--reindex deletes the whole collection, including documents added
+through /admin/upload or scripts/ingest_schemes.py, and re-ingests only
+the HuggingFace datasets. --reembed keeps every stored chunk and only
+replaces its vector, e.g. after scripts/quantize_embedder.py.
+
 Usage:
     python scripts/ingest_data.py
+    python scripts/ingest_data.py --reindex
+    python scripts/ingest_data.py --reembed
 
 Author: Jagadeep Mamidi
 """
@@ -29,12 +40,12 @@ async def main():
     from app.pipeline.ingester import (
         get_collection_stats,
         ingest_all_datasets,
+        reembed_collection,
         reindex_collection,
     )
 
-    logger.info("=" * 50)
-    logger.info("Sahay AI - Data Ingestion Pipeline")
-    logger.info("=" * 50)
+    rule = "=" * 50
+    logger.info(f"{rule}\nSahay AI - Data Ingestion Pipeline\n{rule}")
 
     chroma = get_chroma_client()
     logger.info(f"ChromaDB directory: {chroma.persist_dir}")
@@ -44,18 +55,20 @@ async def main():
     logger.info(f"Current chunks in database: {current_count}")
     force_reindex = "--reindex" in sys.argv
 
-    if current_count > 0 and not force_reindex:
-        logger.info("Collection already has data. Skipping ingestion.")
-        logger.info("Run `python scripts/ingest_data.py --reindex` to rebuild it.")
-        stats = get_collection_stats()
-        logger.info(f"Total chunks: {stats['total_chunks']}")
+    if "--reembed" in sys.argv:
+        count = await reembed_collection()
+        logger.info(f"Re-embedded {count} chunks")
         return
 
-    logger.info(
-        "\nReindexing configured HuggingFace datasets..."
-        if force_reindex
-        else "\nIngesting configured HuggingFace datasets..."
-    )
+    if force_reindex:
+        logger.info("\nReindexing configured HuggingFace datasets...")
+    elif current_count > 0:
+        logger.info(
+            "\nCollection already has data. Updating configured HuggingFace "
+            "datasets (unchanged chunks are skipped)..."
+        )
+    else:
+        logger.info("\nIngesting configured HuggingFace datasets...")
     try:
         results = (
             await reindex_collection() if force_reindex else await ingest_all_datasets()
@@ -66,10 +79,12 @@ async def main():
         logger.error(f"Failed to ingest some datasets: {e}")
 
     stats = get_collection_stats()
-    logger.info("\n" + "=" * 50)
-    logger.info("Ingestion Complete!")
-    logger.info(f"Total chunks: {stats['total_chunks']}")
-    logger.info("=" * 50)
+    logger.info(
+        f"\n{rule}\n"
+        "Ingestion Complete!\n"
+        f"Total chunks: {stats['total_chunks']}\n"
+        f"{rule}"
+    )
 
 
 if __name__ == "__main__":
@@ -18,7 +18,8 @@ import logging
 import os
 import sys
 import hashlib
-import time
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 
 # Add backend directory to path so we can import app modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -70,11 +71,22 @@ def load_dataset_file(file_path: str):
         return []
 
 
+def extract_pdf_text(local_path: str) -> str:
+    """Extract the full text of a PDF with PyMuPDF (runs in a worker process)."""
+    import fitz  # PyMuPDF
+
+    with fitz.open(local_path) as doc:
+        return "".join(page.get_text() for page in doc)
+
+
 def try_load_from_huggingface():
     """Download PDFs from HuggingFace and extract structured scheme data."""
     try:
         from huggingface_hub import list_repo_files, hf_hub_download
-        import fitz  # PyMuPDF
+        # Extraction imports PyMuPDF in the workers; check for it up front so
+        # a missing install fails here with the hint instead of once per PDF
+        if importlib.util.find_spec("fitz") is None:
+            raise ImportError("No module named 'fitz' (PyMuPDF)")
 
         repo_id = "shrijayan/gov_myscheme"
         logger.info(f"Listing files from HuggingFace: {repo_id}...")
@@ -90,37 +102,46 @@ def try_load_from_huggingface():
         records = []
         errors = 0
 
-        for i, pdf_path in enumerate(pdf_files):
-            try:
-                # Download PDF
-                local_path = hf_hub_download(
-                    repo_id=repo_id,
-                    filename=pdf_path,
-                    repo_type="dataset"
-                )
-
-                # Extract text with PyMuPDF
-                doc = fitz.open(local_path)
-                full_text = ""
-                for page in doc:
-                    full_text += page.get_text()
-                doc.close()
-
-                if not full_text.strip():
-                    continue
-
-                # Parse scheme info from text
-                record = parse_scheme_from_text(full_text, pdf_path)
-                if record and record.get("name"):
-                    records.append(record)
-
-                if (i + 1) % 50 == 0:
-                    logger.info(f"  Processed {i + 1}/{len(pdf_files)} PDFs ({len(records)} schemes extracted)")
-
-            except Exception as e:
-                errors += 1
-                if errors <= 5:
-                    logger.warning(f"  Error processing {pdf_path}: {e}")
+        # Downloads stay in this process (I/O bound); text extraction is CPU
+        # bound, so each PDF is handed to a worker process as soon as it lands.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            pending = []
+            for pdf_path in pdf_files:
+                try:
+                    local_path = hf_hub_download(
+                        repo_id=repo_id,
+                        filename=pdf_path,
+                        repo_type="dataset"
+                    )
+                    pending.append((pdf_path, pool.submit(extract_pdf_text, local_path)))
+                except Exception as e:
+                    errors += 1
+                    if errors <= 5:
+                        logger.warning(f"  Error downloading {pdf_path}: {e}")
+
+                attempted = len(pending) + errors
+                if attempted % 50 == 0:
+                    logger.info(f"  Downloaded {len(pending)}/{len(pdf_files)} PDFs")
+
+            for i, (pdf_path, future) in enumerate(pending):
+                try:
+                    full_text = future.result()
+
+                    if not full_text.strip():
+                        continue
+
+                    # Parse scheme info from text
+                    record = parse_scheme_from_text(full_text, pdf_path)
+                    if record and record.get("name"):
+                        records.append(record)
+
+                    if (i + 1) % 50 == 0:
+                        logger.info(f"  Processed {i + 1}/{len(pending)} PDFs ({len(records)} schemes extracted)")
+
+                except Exception as e:
+                    errors += 1
+                    if errors <= 5:
+                        logger.warning(f"  Error processing {pdf_path}: {e}")
 
         logger.info(f"Extracted {len(records)} schemes from {len(pdf_files)} PDFs ({errors} errors)")
         return records if records else None
@@ -435,15 +456,11 @@ def ingest_to_chromadb(schemes: list):
         logger.info(f"Created {len(all_chunks)} chunks from {len(schemes)} schemes")
         
         # Insert in batches
-        batch_size = 20  # Small batches to avoid Gemini rate limits
+        batch_size = 96  # Matches EmbedderService.embed_documents batch size
         for i in range(0, len(all_chunks), batch_size):
             batch = all_chunks[i:i + batch_size]
             retriever.add_documents_batch(batch)
             logger.info(f"  Embedded batch {i // batch_size + 1}: {min(i + batch_size, len(all_chunks))} / {len(all_chunks)}")
-            
-            # Small delay to respect Gemini API rate limits
-            if i + batch_size < len(all_chunks):
-                time.sleep(1)
         
         stats = retriever.get_stats()
         logger.info(f"✅ ChromaDB stats: {stats}")
@@ -456,9 +473,8 @@ def ingest_to_chromadb(schemes: list):
 
 def main():
     """Main ingestion pipeline."""
-    logger.info("=" * 60)
-    logger.info("Sahay AI - Scheme Data Ingestion")
-    logger.info("=" * 60)
+    rule = "=" * 60
+    logger.info(f"{rule}\nSahay AI - Scheme Data Ingestion\n{rule}")
     
     # Step 1: Load data
     raw_schemes = None
@@ -510,26 +526,31 @@ def main():
     logger.info(f"📋 Normalized {len(schemes)} unique schemes")
     
     # Show first few
-    for s in schemes[:5]:
-        logger.info(f"  - {s['name']} [{s['category']}]")
+    preview = [f"  - {s['name']} [{s['category']}]" for s in schemes[:5]]
     if len(schemes) > 5:
-        logger.info(f"  ... and {len(schemes) - 5} more")
+        preview.append(f"  ... and {len(schemes) - 5} more")
+    if preview:
+        logger.info("\n".join(preview))
     
     # Step 3: Ingest to Supabase
     logger.info("\n--- Ingesting to Supabase ---")
     supabase_count = ingest_to_supabase(schemes)
     
     # Step 4: Ingest to ChromaDB (embeddings)
-    logger.info("\n--- Ingesting to ChromaDB ---")
-    logger.info("(This will take a few minutes due to embedding generation...)")
+    logger.info(
+        "\n--- Ingesting to ChromaDB ---\n"
+        "(This will take a few minutes due to embedding generation...)"
+    )
     chromadb_count = ingest_to_chromadb(schemes)
     
     # Summary
-    logger.info("\n" + "=" * 60)
-    logger.info("✅ INGESTION COMPLETE")
-    logger.info(f"   Supabase: {supabase_count} schemes")
-    logger.info(f"   ChromaDB: {chromadb_count} chunks")
-    logger.info("=" * 60)
+    logger.info(
+        f"\n{rule}\n"
+        "✅ INGESTION COMPLETE\n"
+        f"   Supabase: {supabase_count} schemes\n"
+        f"   ChromaDB: {chromadb_count} chunks\n"
+        f"{rule}"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+"""
+Sahay AI - Embedder Quantization Script
+=======================================
+
+One-time script that applies dynamic INT8 quantization to the exported
+ONNX embedding model. The embedder loads the quantized graph on the next
+startup (set EMBEDDING_QUANTIZED=false to opt out).
+
+Stored passages keep their FP32 vectors, so re-embed them afterwards;
+otherwise queries are embedded by a different model than the documents.
+Requires the ONNX backend on CPU (set EMBEDDING_DEVICE=cpu on GPU hosts).
+
+The chosen arch is recorded in EMBEDDING_QUANTIZATION_FILE on the data
+disk. The INT8 graph itself lives in the non-persisted model cache, and
+the embedder rebuilds it from that record after a redeploy.
+
+Usage:
+    python scripts/quantize_embedder.py
+    python scripts/quantize_embedder.py --arch avx2
+    python scripts/ingest_data.py --reembed
+
+Author: Jagadeep Mamidi
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Quantize the cached ONNX embedding model to INT8."""
+    from app.core.config import get_settings
+    from app.services.embedder import (
+        QUANTIZATION_ARCHS,
+        QUANTIZED_ONNX_FILE_NAME,
+        EmbedderService,
+        quantize_onnx_model,
+    )
+
+    arch = "avx512_vnni"
+    if "--arch" in sys.argv:
+        arch = sys.argv[sys.argv.index("--arch") + 1]
+    if arch not in QUANTIZATION_ARCHS:
+        logger.error(f"Unknown arch: {arch}. Available: {list(QUANTIZATION_ARCHS)}")
+        sys.exit(1)
+
+    settings = get_settings()
+    if settings.embedding_backend != "onnx":
+        logger.error("Quantization requires EMBEDDING_BACKEND=onnx")
+        sys.exit(1)
+
+    # Loading the embedder exports and caches the FP32 ONNX graph if needed
+    embedder = EmbedderService()
+    if embedder.backend != "onnx":
+        # Accelerator devices always run the PyTorch model
+        logger.error(
+            f"Embedder resolved to the {embedder.backend} backend on "
+            f"{embedder.device}; set EMBEDDING_DEVICE=cpu to quantize"
+        )
+        sys.exit(1)
+    local_dir = embedder.local_model_dir
+    record = Path(settings.embedding_quantization_path)
+
+    if (local_dir / QUANTIZED_ONNX_FILE_NAME).exists():
+        if record.exists():
+            logger.info(
+                f"Quantized model already exists in {local_dir}. Nothing to do."
+            )
+            return
+        # Graphs quantized before the record existed; later rebuilds reuse it
+        logger.info(
+            f"Quantized model already exists in {local_dir}. Recording it as "
+            f"{arch}; pass --arch if it was quantized for another target."
+        )
+    else:
+        logger.info(f"Quantizing {embedder.model_name} for {arch} (dynamic INT8)...")
+        quantize_onnx_model(embedder.model, local_dir, arch)
+        logger.info(f"Saved {QUANTIZED_ONNX_FILE_NAME} to {local_dir}")
+
+    record.parent.mkdir(parents=True, exist_ok=True)
+    record.write_text(arch)
+    logger.info(
+        f"Recorded arch {arch} in {record}\n"
+        "Stored passages still have FP32 vectors. Re-embed them so they "
+        "match the INT8 query embeddings:\n"
+        "    python scripts/ingest_data.py --reembed"
+    )
+
+
+if __name__ == "__main__":
+    main()
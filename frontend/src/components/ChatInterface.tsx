@@ -2,7 +2,7 @@
 
 import { Fragment, useState, useRef, useEffect } from "react";
 import { ChatMessage, ChatResponse, SchemeCard } from "@/types";
-import { sendMessage as sendChatMessage } from "@/lib/api";
+import { streamMessage } from "@/lib/api";
 import { VoiceInputButton, synthesizeSpeech } from "./VoiceInput";
 import { LanguageSelector } from "./LanguageSelector";
 
@@ -231,11 +231,40 @@ export function ChatInterface() {
     setIsLoading(true);
 
     try {
-      const data = (await sendChatMessage(
+      // Render tokens as they arrive; the final "done" event replaces the
+      // streamed text with the complete response and its scheme cards.
+      let data: ChatResponse | null = null;
+      let streamed = "";
+      let started = false;
+
+      for await (const event of streamMessage(
         text,
         sessionId || undefined,
         language === "auto" ? "auto" : language,
-      )) as ChatResponse;
+      )) {
+        if (event.type === "error") {
+          throw new Error(event.detail);
+        }
+        if (event.type === "done") {
+          data = event;
+          break;
+        }
+
+        streamed += event.content;
+        const partial: Message = {
+          role: "assistant",
+          content: streamed,
+          timestamp: new Date().toISOString(),
+        };
+        setMessages((prev) =>
+          started ? [...prev.slice(0, -1), partial] : [...prev, partial],
+        );
+        started = true;
+      }
+
+      if (!data) {
+        throw new Error("Response stream ended unexpectedly");
+      }
 
       if (!sessionId) {
         setSessionId(data.session_id);
@@ -249,7 +278,9 @@ export function ChatInterface() {
         schemes: data.schemes,
         suggestedQuestions: data.suggested_questions,
       };
-      setMessages((prev) => [...prev, aiMessage]);
+      setMessages((prev) =>
+        started ? [...prev.slice(0, -1), aiMessage] : [...prev, aiMessage],
+      );
 
       if (data.message) {
         const responseLang = data.response_language || language || "en";
@@ -429,7 +460,7 @@ export function ChatInterface() {
           </div>
         ))}
 
-        {isLoading && (
+        {isLoading && messages[messages.length - 1]?.role !== "assistant" && (
           <div className="flex justify-start">
             <div className="glass-card px-4 py-3 rounded-2xl rounded-bl-sm">
               <div className="flex items-center gap-2">
@@ -1,5 +1,7 @@
 // API client for Sahay AI backend
 
+import { ChatResponse } from "@/types";
+
 const API_BASE_URL =
   process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000/api/v1";
 
@@ -65,6 +67,60 @@ export async function sendMessage(
   });
 }
 
+export type ChatStreamEvent =
+  | { type: "token"; content: string }
+  | ({ type: "done" } & ChatResponse)
+  | { type: "error"; detail: string };
+
+// Streams NDJSON events from /chat/stream; ends with a "done" or "error" event
+export async function* streamMessage(
+  message: string,
+  sessionId?: string,
+  language: string = "auto",
+  userProfile?: Record<string, unknown>,
+): AsyncGenerator<ChatStreamEvent> {
+  const response = await fetch(`${API_BASE_URL}/chat/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({
+      message,
+      session_id: sessionId,
+      language,
+      user_profile: userProfile,
+    }),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response
+      .json()
+      .catch(() => ({ detail: "An error occurred" }));
+    throw new Error(error.detail || `HTTP ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = "";
+
+  while (true) {
+    const { done, value } = await reader.read();
+    buffered += decoder.decode(value, { stream: !done });
+
+    const lines = buffered.split("\n");
+    buffered = lines.pop() ?? "";
+    for (const line of lines) {
+      if (line.trim()) {
+        yield JSON.parse(line) as ChatStreamEvent;
+      }
+    }
+
+    if (done) break;
+  }
+
+  if (buffered.trim()) {
+    yield JSON.parse(buffered) as ChatStreamEvent;
+  }
+}
+
 export async function getChatHistory(sessionId: string) {
   return fetchAPI(`/chat/history/${sessionId}`);
 }